@@ -1,11 +1,29 @@
 #!/usr/bin/env python3
 """Run precommit checks on the repository."""
 import argparse
+import concurrent.futures
 import os
 import pathlib
-import re
 import subprocess
 import sys
+from typing import Iterable, List, Tuple
+
+
+def strip_trailing_whitespace(text: str) -> str:
+    """Remove the trailing whitespace from every line of the text."""
+    return '\n'.join(line.rstrip(' \t') for line in text.split('\n'))
+
+
+def py_files(roots: Iterable[pathlib.Path]) -> List[str]:
+    """Collect the sorted paths to all the ``*.py`` files beneath the given root directories."""
+    result = []  # type: List[str]
+    for root in roots:
+        for dirpath, _, filenames in os.walk(str(root)):
+            for filename in filenames:
+                if filename.endswith('.py'):
+                    result.append(os.path.join(dirpath, filename))
+
+    return sorted(result)
 
 
 def main() -> int:
@@ -25,58 +43,73 @@ def main() -> int:
 
     repo_root = pathlib.Path(__file__).parent
 
-    # yapf: disable
-    source_files = (
-                sorted((repo_root / "temppathlib").glob("**/*.py")) +
-                sorted((repo_root / "tests").glob("**/*.py")))
-    # yapf: enable
+    source_files = py_files([repo_root / "temppathlib", repo_root / "tests"])
 
     if overwrite:
         print('Removing trailing whitespace...')
         for pth in source_files:
-            pth.write_text(re.sub(r'[ \t]+$', '', pth.read_text(), flags=re.MULTILINE))
+            with open(pth, 'rt', encoding='utf-8') as fid:
+                text = fid.read()
+
+            with open(pth, 'wt', encoding='utf-8') as fid:
+                fid.write(strip_trailing_whitespace(text))
 
-    print("YAPF'ing...")
     yapf_targets = ["tests", "temppathlib", "setup.py", "precommit.py"]
+
+    # yapf: disable
+    yapf_cmd = (
+            ["yapf", "--in-place" if overwrite else "--diff", "--style=style.yapf", "--recursive"] +
+            yapf_targets)
+
+    isort_cmd = (
+            ["isort", "--project", "temppathlib", '--line-width', '120'] +
+            ([] if overwrite else ['--check-only']) +
+            source_files)
+    # yapf: enable
+
+    checks = []  # type: List[Tuple[str, List[str]]]
+
     if overwrite:
-        # yapf: disable
-        subprocess.check_call(
-            ["yapf", "--in-place", "--style=style.yapf", "--recursive"] +
-            yapf_targets,
-            cwd=str(repo_root))
-        # yapf: enable
+        # The formatters rewrite the files in place, so they must not race with the read-only checks.
+        print("YAPF'ing...")
+        subprocess.check_call(yapf_cmd, cwd=str(repo_root))
+
+        print("Isort'ing...")
+        subprocess.check_call(isort_cmd, cwd=str(repo_root))
     else:
-        # yapf: disable
-        subprocess.check_call(
-            ["yapf", "--diff", "--style=style.yapf", "--recursive"] +
-            yapf_targets,
-            cwd=str(repo_root))
-        # yapf: enable
+        checks.append(("yapf", yapf_cmd))
+        checks.append(("isort", isort_cmd))
 
-    print("Mypy'ing...")
-    subprocess.check_call(["mypy", "--strict", "temppathlib", "tests"], cwd=str(repo_root))
+    checks.append(("mypy", ["mypy", "--strict", "temppathlib", "tests"]))
+    checks.append(("pydocstyle", ["pydocstyle", "temppathlib"]))
+    checks.append(("pylint", ["pylint", "--rcfile=pylint.rc", "tests", "temppathlib"]))
 
-    print("Isort'ing...")
-    # yapf: disable
-    isort_files = map(str, source_files)
-    # yapf: enable
+    print("Checking in parallel: {}...".format(", ".join(name for name, _ in checks)))
 
-    # yapf: disable
-    subprocess.check_call(
-        ["isort", "--project", "temppathlib", '--line-width', '120'] +
-        ([] if overwrite else ['--check-only']) +
-        [str(pth) for pth in source_files])
-    # yapf: enable
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        # yapf: disable
+        futures = [
+            executor.submit(
+                subprocess.run, cmd, cwd=str(repo_root), stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT, universal_newlines=True)
+            for _, cmd in checks]
+        # yapf: enable
+
+        success = True
+        for (name, _), future in zip(checks, futures):
+            proc = future.result()
+            if proc.stdout:
+                sys.stdout.write(proc.stdout)
 
-    print("Pydocstyle'ing...")
-    subprocess.check_call(["pydocstyle", "temppathlib"], cwd=str(repo_root))
+            if proc.returncode != 0:
+                print(f"Failed: {name}")
+                success = False
 
-    print("Pylint'ing...")
-    subprocess.check_call(["pylint", "--rcfile=pylint.rc", "tests", "temppathlib"], cwd=str(repo_root))
+    if not success:
+        return 1
 
     print("Testing...")
-    env = os.environ.copy()
-    env['ICONTRACT_SLOW'] = 'true'
+    env = {**os.environ, 'ICONTRACT_SLOW': 'true'}
 
     # yapf: disable
     subprocess.check_call(
@@ -90,10 +123,9 @@ def main() -> int:
     subprocess.check_call(["coverage", "report"])
 
     print("Doctesting...")
-    doctest_files = ([repo_root / "README.rst"] + sorted((repo_root / "temppathlib").glob("**/*.py")))
+    doctest_files = ([str(repo_root / "README.rst")] + py_files([repo_root / "temppathlib"]))
 
-    for pth in doctest_files:
-        subprocess.check_call([sys.executable, "-m", "doctest", str(pth)])
+    subprocess.check_call([sys.executable, "-m", "doctest"] + doctest_files, cwd=str(repo_root))
 
     print("Checking setup.py sdist ...")
     subprocess.check_call([sys.executable, "setup.py", "sdist"], cwd=str(repo_root))
@@ -1,22 +1,52 @@
 """Wrap tempfile to give you pathlib.Path."""
 
+import os
 import pathlib
 import shutil
 import tempfile
-from typing import IO, Any, Optional, Union  # pylint: disable=unused-import
+from typing import IO, Any, Callable, Dict, Optional, Tuple, Union  # pylint: disable=unused-import
+
+# yapf: disable
+_PATH_COERCION = {
+    str: pathlib.Path,
+    pathlib.Path: lambda path: path,
+    type(pathlib.Path()): lambda path: path,
+}  # type: Dict[type, Callable[[Any], pathlib.Path]]
+# yapf: enable
+
+
+def _coerce_to_path(value: Union[str, pathlib.Path], name: str) -> pathlib.Path:
+    """
+    Convert the value of an argument to a path.
+
+    The conversion is dispatched on the exact type so that the common cases skip the isinstance checks.
+
+    :param value: value of the argument
+    :param name: name of the argument, used in the error message
+    :return: value as a path
+    """
+    try:
+        return _PATH_COERCION[type(value)](value)
+    except KeyError:
+        pass
+
+    if isinstance(value, pathlib.Path):
+        return value
+
+    raise ValueError(f"Unexpected type of '{name}': {type(value)}")
 
 
 class removing_tree:  # pylint: disable=invalid-name
     """Check if the path exists, and if it does, calls shutil.rmtree on it."""
 
+    __slots__ = ('path', '_path_str')
+
     def __init__(self, path: Union[str, pathlib.Path]) -> None:
         """Initialize with the given value."""
-        if isinstance(path, str):
-            self.path = pathlib.Path(path)
-        elif isinstance(path, pathlib.Path):
-            self.path = path
-        else:
-            raise ValueError(f"Unexpected type of 'path': {type(path)}")
+        self.path = _coerce_to_path(path, 'path')
+
+        # Keep the str form around so that the removal does not need to re-render the path.
+        self._path_str = str(self.path)
 
     def __enter__(self) -> pathlib.Path:
         """Give back the path that will be removed."""
@@ -24,8 +54,10 @@ class removing_tree:  # pylint: disable=invalid-name
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:  # type: ignore
         """Remove the path if it exists."""
-        if self.path.exists():
-            shutil.rmtree(str(self.path))
+        try:
+            shutil.rmtree(self._path_str)
+        except FileNotFoundError:
+            pass
 
 
 class TmpDirIfNecessary:
@@ -38,6 +70,9 @@ class TmpDirIfNecessary:
     directory needs to be created), its name is generated only on enter.
     """
 
+    __slots__ = ('base_tmp_dir', '_path', '_path_str', 'path', 'dont_delete', '_prefix', '_suffix', '__use_tmp_dir',
+                 'exited')
+
     def __init__(self,
                  path: Union[None, str, pathlib.Path],
                  base_tmp_dir: Union[None, str, pathlib.Path] = None,
@@ -69,24 +104,17 @@ class TmpDirIfNecessary:
             otherwise a default suffix is used.
         """
         if base_tmp_dir is None:
-            self.base_tmp_dir = base_tmp_dir
-        elif isinstance(base_tmp_dir, pathlib.Path):
-            self.base_tmp_dir = base_tmp_dir
-        elif isinstance(base_tmp_dir, str):
-            self.base_tmp_dir = pathlib.Path(base_tmp_dir)
+            self.base_tmp_dir = base_tmp_dir  # type: Optional[pathlib.Path]
         else:
-            raise ValueError(f"Unexpected type of 'base_tmp_dir': {type(base_tmp_dir)}")
+            self.base_tmp_dir = _coerce_to_path(base_tmp_dir, 'base_tmp_dir')
 
-        self._path = None  # type: Optional[pathlib.Path]
+        self._path_str = None  # type: Optional[str]
 
         if path is None:
-            pass
-        elif isinstance(path, str):
-            self._path = pathlib.Path(path)
-        elif isinstance(path, pathlib.Path):
-            self._path = path
+            self._path = None  # type: Optional[pathlib.Path]
         else:
-            raise ValueError(f"Unexpected type for the argument `path`: {type(path)}")
+            self._path = _coerce_to_path(path, 'path')
+            self.path = self._path
 
         self.dont_delete = dont_delete_tmp_dir
 
@@ -97,14 +125,13 @@ class TmpDirIfNecessary:
 
         self.exited = False
 
-    @property
-    def path(self) -> pathlib.Path:
-        """Get the underlying path or raise if the path has not been set."""
-        if self._path is None:
+    def __getattr__(self, name: str) -> Any:
+        """Raise for an access to 'path' before it has been set."""
+        if name == 'path':
             raise RuntimeError("The _path has not been set. "
                                f"Are you using {self.__class__.__name__} outside of the context management?")
 
-        return self._path
+        raise AttributeError(name)
 
     def __enter__(self) -> 'TmpDirIfNecessary':
         """Create the temporary directory if necessary."""
@@ -113,10 +140,15 @@ class TmpDirIfNecessary:
 
         if self._path is None:
             if self.base_tmp_dir is None:
-                self._path = pathlib.Path(tempfile.mkdtemp(prefix=self._prefix, suffix=self._suffix))
+                self._path_str = tempfile.mkdtemp(prefix=self._prefix, suffix=self._suffix)
             else:
-                self._path = pathlib.Path(
-                    tempfile.mkdtemp(dir=str(self.base_tmp_dir), prefix=self._prefix, suffix=self._suffix))
+                self._path_str = tempfile.mkdtemp(
+                    dir=os.fspath(self.base_tmp_dir), prefix=self._prefix, suffix=self._suffix)
+
+            self._path = pathlib.Path(self._path_str)
+
+            # Set the path as a plain attribute so that the accesses need not go through a property.
+            self.path = self._path
         else:
             self._path.mkdir(exist_ok=True, parents=True)
 
@@ -124,8 +156,8 @@ class TmpDirIfNecessary:
 
     def __exit__(self, exc_type, exc_val, exc_tb):  # type: ignore
         """Remove the directory if dont_delete has not been set."""
-        if self.__use_tmp_dir and not self.dont_delete:
-            shutil.rmtree(str(self._path))
+        if self.__use_tmp_dir and not self.dont_delete and self._path_str is not None:
+            shutil.rmtree(self._path_str)
 
 
 class TemporaryDirectory:
@@ -135,6 +167,8 @@ class TemporaryDirectory:
     The path to the temporary directory is generated and the directory is created only on __enter__.
     """
 
+    __slots__ = ('exited', '_path', '_path_str', 'path', 'base_tmp_dir', 'prefix', 'dont_delete')
+
     def __init__(self,
                  base_tmp_dir: Union[None, str, pathlib.Path] = None,
                  prefix: Optional[str] = None,
@@ -148,15 +182,12 @@ class TemporaryDirectory:
         """
         self.exited = False
         self._path = None  # type: Optional[pathlib.Path]
+        self._path_str = None  # type: Optional[str]
 
         if base_tmp_dir is None:
-            self.base_tmp_dir = base_tmp_dir
-        elif isinstance(base_tmp_dir, pathlib.Path):
-            self.base_tmp_dir = base_tmp_dir
-        elif isinstance(base_tmp_dir, str):
-            self.base_tmp_dir = pathlib.Path(base_tmp_dir)
+            self.base_tmp_dir = base_tmp_dir  # type: Optional[pathlib.Path]
         else:
-            raise ValueError(f"Unexpected type of 'base_tmp_dir': {type(base_tmp_dir)}")
+            self.base_tmp_dir = _coerce_to_path(base_tmp_dir, 'base_tmp_dir')
 
         self.prefix = prefix
         self.dont_delete = dont_delete
@@ -166,19 +197,22 @@ class TemporaryDirectory:
         if self.exited:
             raise RuntimeError("Already exited")
 
-        base_tmp_dir = str(self.base_tmp_dir) if self.base_tmp_dir is not None else None
-        self._path = pathlib.Path(tempfile.mkdtemp(prefix=self.prefix, dir=base_tmp_dir))
+        base_tmp_dir = os.fspath(self.base_tmp_dir) if self.base_tmp_dir is not None else None
+        self._path_str = tempfile.mkdtemp(prefix=self.prefix, dir=base_tmp_dir)
+        self._path = pathlib.Path(self._path_str)
+
+        # Set the path as a plain attribute so that the accesses need not go through a property.
+        self.path = self._path
 
         return self
 
-    @property
-    def path(self) -> pathlib.Path:
-        """Get the underlying path or raise if the path has not been set."""
-        if self._path is None:
+    def __getattr__(self, name: str) -> Any:
+        """Raise for an access to 'path' before it has been set."""
+        if name == 'path':
             raise RuntimeError("The _path has not been set. "
                                f"Are you using {self.__class__.__name__} outside of the context management?")
 
-        return self._path
+        raise AttributeError(name)
 
     def close(self) -> None:
         """
@@ -188,8 +222,11 @@ class TemporaryDirectory:
 
         """
         if not self.exited:
-            if not self.dont_delete and self._path is not None and self._path.exists():
-                shutil.rmtree(str(self._path))
+            if not self.dont_delete and self._path_str is not None:
+                try:
+                    shutil.rmtree(self._path_str)
+                except FileNotFoundError:
+                    pass
 
             self.exited = True
 
@@ -201,6 +238,8 @@ class TemporaryDirectory:
 class NamedTemporaryFile:
     """Wrap tempfile.NamedTemporaryFile with pathlib.Path."""
 
+    __slots__ = ('__tmpfile', '_path', 'file', 'delete')
+
     def __init__(
             self,
             mode: str = 'w+b',
@@ -239,15 +278,23 @@ class NamedTemporaryFile:
             newline=newline,
             suffix=suffix,
             prefix=prefix,
-            dir=str(dir) if dir is not None else None,
+            dir=os.fspath(dir) if dir is not None else None,
             delete=delete)
 
-        self.path = pathlib.Path(self.__tmpfile.name)
+        self._path = None  # type: Optional[pathlib.Path]
 
         file = self.__tmpfile.file
         self.file = file  # type: IO[Any]
         self.delete = delete
 
+    @property
+    def path(self) -> pathlib.Path:
+        """Get the path to the temporary file; the path is constructed lazily on the first access."""
+        if self._path is None:
+            self._path = pathlib.Path(self.__tmpfile.name)
+
+        return self._path
+
     def close(self) -> None:
         """Forward close request to the underlying temporary file."""
         self.__tmpfile.close()
@@ -261,11 +308,26 @@ class NamedTemporaryFile:
         self.close()
 
 
+_TMPDIR_CACHE = (None, None)  # type: Tuple[Optional[str], Optional[pathlib.Path]]
+
+
 def gettempdir() -> pathlib.Path:
     """
     Wrap ``tempfile.gettempdir``.
 
+    The resulting path is cached at the module level, so repeated calls share a single ``pathlib.Path``
+    as long as ``tempfile`` keeps reporting the same directory.
+
     Please see the documentation of ``tempfile.gettempdir`` for more details:
     https://docs.python.org/3/library/tempfile.html#tempfile.gettempdir
     """
-    return pathlib.Path(tempfile.gettempdir())
+    global _TMPDIR_CACHE  # pylint: disable=global-statement
+
+    tmp_dir_str = tempfile.gettempdir()
+
+    cached_str, cached_path = _TMPDIR_CACHE
+    if cached_path is None or cached_str != tmp_dir_str:
+        cached_path = pathlib.Path(tmp_dir_str)
+        _TMPDIR_CACHE = (tmp_dir_str, cached_path)
+
+    return cached_path
@@ -5,7 +5,6 @@
 import copy
 import os
 import pathlib
-import shutil
 import tempfile
 import unittest
 from typing import Optional  # pylint: disable=unused-import
@@ -15,9 +14,9 @@ import temppathlib
 
 class TestRemovingTree(unittest.TestCase):
     def test_that_it_works(self) -> None:
-        tmp_dir = pathlib.Path(tempfile.mkdtemp())
+        with tempfile.TemporaryDirectory() as tmp_dir_str:
+            tmp_dir = pathlib.Path(tmp_dir_str)
 
-        try:
             pth = tmp_dir / 'oioi'
             pth.mkdir()
             with temppathlib.removing_tree(path=pth):
@@ -32,14 +31,10 @@ class TestRemovingTree(unittest.TestCase):
 
             self.assertFalse(pth.exists())
 
-        finally:
-            if tmp_dir.exists():
-                shutil.rmtree(str(tmp_dir))
-
     def test_no_enter(self) -> None:
-        tmp_dir = pathlib.Path(tempfile.mkdtemp())
+        with tempfile.TemporaryDirectory() as tmp_dir_str:
+            tmp_dir = pathlib.Path(tmp_dir_str)
 
-        try:
             dir1 = tmp_dir / "dir1"
             dir1.mkdir()
             dir2 = tmp_dir / "dir2"
@@ -60,29 +55,23 @@ class TestRemovingTree(unittest.TestCase):
 
             names = sorted(pth.name for pth in tmp_dir.iterdir())
             self.assertListEqual(names, ['dir2'])
-        finally:
-            if tmp_dir.exists():
-                shutil.rmtree(str(tmp_dir))
 
 
 class TestTmpDirIfNecessary(unittest.TestCase):
     def test_with_path_str(self) -> None:
-        basedir = pathlib.Path(tempfile.mkdtemp())
+        with tempfile.TemporaryDirectory() as basedir_str:
+            basedir = pathlib.Path(basedir_str)
 
-        try:
             notmp_pth = str(basedir / "no-tmp")
             with temppathlib.TmpDirIfNecessary(path=notmp_pth) as maybe_tmp_dir:
                 self.assertEqual(pathlib.Path(notmp_pth), maybe_tmp_dir.path)
 
             self.assertTrue(os.path.exists(notmp_pth))
 
-        finally:
-            shutil.rmtree(str(basedir))
-
     def test_with_base_tmp_dir(self) -> None:
-        basedir = pathlib.Path(tempfile.mkdtemp())
+        with tempfile.TemporaryDirectory() as basedir_str:
+            basedir = pathlib.Path(basedir_str)
 
-        try:
             tmp_pth = None  # type: Optional[pathlib.Path]
             with temppathlib.TmpDirIfNecessary(path=None, base_tmp_dir=basedir) as maybe_tmp_dir:
                 tmp_pth = maybe_tmp_dir.path
@@ -91,9 +80,6 @@ class TestTmpDirIfNecessary(unittest.TestCase):
 
             self.assertFalse(tmp_pth.exists())
 
-        finally:
-            shutil.rmtree(str(basedir))
-
     def test_prefix(self) -> None:
         with temppathlib.TmpDirIfNecessary(path=None, prefix="some_prefix") as tmp_dir:
             self.assertTrue(tmp_dir.path.name.startswith("some_prefix"))
@@ -105,9 +91,9 @@ class TestTmpDirIfNecessary(unittest.TestCase):
 
 class TestTemporaryDirectory(unittest.TestCase):
     def test_that_it_works(self) -> None:
-        tmp_dir = pathlib.Path(tempfile.mkdtemp())
+        with tempfile.TemporaryDirectory() as tmp_dir_str:
+            tmp_dir = pathlib.Path(tmp_dir_str)
 
-        try:
             another_tmp_dir_pth = None  # type: Optional[pathlib.Path]
             with temppathlib.TemporaryDirectory(base_tmp_dir=tmp_dir) as another_tmp_dir:
                 another_tmp_dir_pth = copy.copy(another_tmp_dir.path)
@@ -116,10 +102,6 @@ class TestTemporaryDirectory(unittest.TestCase):
 
             self.assertFalse(another_tmp_dir_pth.exists())
 
-        finally:
-            if tmp_dir.exists():
-                shutil.rmtree(str(tmp_dir))
-
     def test_with_prefix(self) -> None:
         with temppathlib.TemporaryDirectory(prefix='some-prefix') as tmp_dir:
             self.assertTrue(tmp_dir.path.name.startswith('some-prefix'))